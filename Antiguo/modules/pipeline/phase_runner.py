@@ -1,16 +1,79 @@
 from abc import ABC, abstractmethod
+import atexit
+import hashlib
 import subprocess
+import threading
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from typing import ClassVar, List, Optional, Dict, Any, Tuple
 from config.config_manager import PipelineConfig
+from pipeline.worker import read_frame, write_frame
 import sys
 import os
 import json
 import csv
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
+from operator import itemgetter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+WORKER_COMMAND = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")]
+
+SCIENCEDIRECT_APIKEY_FILE = os.path.join("secrets", "sciencedirect_apikey.txt")
+
+# Below this many articles, domain analysis stays in-process
+PARALLEL_MIN_ARTICLES = 5000
+
+class _NormalizeTable(dict):
+    r"""str.translate table that maps non-word characters and digits to spaces.
+
+    Entries are filled on first lookup so any Unicode character is handled the
+    same way as the regexes [^\w\s] and \d would handle it.
+    """
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        if char.isdecimal() or not (char.isalnum() or char == '_' or char.isspace()):
+            value = ' '
+        else:
+            value = char
+        self[codepoint] = value
+        return value
+
+_NORMALIZE_TABLE = _NormalizeTable()
+
+@lru_cache(maxsize=None)
+def load_domain_terms(filepath: str) -> Tuple[str, ...]:
+    """Load domain terms from a CSV file, parsing each file only once per run."""
+    if not filepath or not os.path.exists(filepath):
+        return ()
+        
+    terms = []
+    try:
+        with open(filepath, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                if row and row[0].strip():
+                    terms.append(row[0].strip())
+                    
+        print(f"Se cargaron {len(terms)} términos desde {filepath}")
+        return tuple(terms)
+    except Exception as e:
+        print(f"Error al cargar términos desde {filepath}: {str(e)}")
+        return ()
 
 class PhaseRunner(ABC):
+    _PY: ClassVar[str] = sys.executable
+    _worker: ClassVar[Optional[subprocess.Popen]] = None
+    _worker_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Names of the phase classes whose outputs this phase reads
+    dependencies: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, config: PipelineConfig):
         self.config = config
     
@@ -22,6 +85,48 @@ class PhaseRunner(ABC):
     def get_description(self) -> str:
         pass
     
+    @classmethod
+    def _get_worker(cls) -> subprocess.Popen:
+        """Return the shared phase worker, starting it on first use."""
+        worker = PhaseRunner._worker
+        if worker is None or worker.poll() is not None:
+            worker = subprocess.Popen(WORKER_COMMAND, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            PhaseRunner._worker = worker
+        return worker
+    
+    @classmethod
+    def shutdown_worker(cls) -> None:
+        """Close the shared phase worker, if one was started."""
+        worker = PhaseRunner._worker
+        if worker is None:
+            return
+        PhaseRunner._worker = None
+        if worker.poll() is None:
+            worker.stdin.close()
+            worker.wait()
+    
+    def _settings_digest(self, settings: Dict[str, Any]) -> str:
+        """Hash the settings that determine a phase's outputs."""
+        encoded = json.dumps(settings, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _inputs_unchanged(self, inputs: List[str], outputs: List[str], settings: Dict[str, Any]) -> bool:
+        """Return True if all outputs are newer than all inputs and were built with the same settings."""
+        cache_file = outputs[0] + ".cache"
+        if not all(os.path.exists(path) for path in inputs + outputs + [cache_file]):
+            return False
+        
+        if max(os.path.getmtime(path) for path in inputs) >= min(os.path.getmtime(path) for path in outputs):
+            return False
+        
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            return file.read().strip() == self._settings_digest(settings)
+    
+    def _mark_outputs_current(self, outputs: List[str], settings: Dict[str, Any]) -> None:
+        """Record the settings the outputs were built with, for _inputs_unchanged."""
+        with open(outputs[0] + ".cache", 'w', encoding='utf-8') as file:
+            file.write(self._settings_digest(settings))
+    
     def run(self) -> bool:
         try:
             print(f"\n===== EJECUTANDO: {self.get_description()} =====")
@@ -29,28 +134,65 @@ class PhaseRunner(ABC):
             print(f"Comando: {' '.join(command)}")
             print("-" * 50)
             
-            result = subprocess.run(command, check=True)
-            return result.returncode == 0
-            
-        except subprocess.CalledProcessError as e:
-            print(f"\nERROR: El comando falló con código {e.returncode}")
-            print(f"Output: {e.output if hasattr(e, 'output') else 'No output'}")
-            return False
+            # Phases running concurrently take turns on the shared worker
+            with PhaseRunner._worker_lock:
+                # command is [python, script, *args]; the worker replaces the interpreter launch
+                worker = self._get_worker()
+                write_frame(worker.stdin, {"phase": command[1], "args": command[2:]})
+                
+                # A stuck phase is aborted by killing the worker; the next phase starts a new one
+                timeout = getattr(self.config, 'phase_timeout', None)
+                timed_out = threading.Event()
+                
+                def abort() -> None:
+                    timed_out.set()
+                    worker.kill()
+                
+                watchdog = threading.Timer(timeout, abort) if timeout else None
+                if watchdog:
+                    watchdog.start()
+                try:
+                    # Echo output as the phase produces it, until the final status frame
+                    response = read_frame(worker.stdout)
+                    while response is not None and "status" not in response:
+                        print(response["stdout"], end="", flush=True)
+                        response = read_frame(worker.stdout)
+                finally:
+                    if watchdog:
+                        watchdog.cancel()
+                
+                if response is None:
+                    # Reap the dead worker so the next phase starts a fresh one
+                    worker.wait()
+                    if timed_out.is_set():
+                        print(f"\nERROR: La fase superó el tiempo límite de {timeout} segundos")
+                    else:
+                        print("\nERROR: El worker de fases terminó inesperadamente")
+                    return False
+            
+            if response["status"] != 0:
+                print(f"\nERROR: El comando falló con código {response['status']}")
+                return False
+            return True
             
         except Exception as e:
             print(f"\nERROR: Ocurrió una excepción al ejecutar el comando: {str(e)}")
             return False
 
+atexit.register(PhaseRunner.shutdown_worker)
+
 class SearchPhase(PhaseRunner):
     """Phase runner for academic search and integration."""
+    _SCRIPT: ClassVar[str] = "main_script.py"
+
     def __init__(self, config: PipelineConfig):
         self.config = config
 
     def get_command(self) -> List[str]:
         """For backward compatibility with subprocess execution"""
         cmd = [
-            sys.executable,
-            "main_script.py",
+            self._PY,
+            self._SCRIPT,
             "--domain1", self.config.domain1,
             "--domain2", self.config.domain2,
             "--domain3", self.config.domain3,
@@ -119,36 +261,55 @@ class SearchPhase(PhaseRunner):
     
     def _load_domain_terms(self, filepath: str) -> List[str]:
         """Load domain terms from a CSV file."""
-        if not filepath or not os.path.exists(filepath):
-            return []
-            
-        terms = []
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                import csv
-                reader = csv.reader(file)
-                for row in reader:
-                    if row and row[0].strip():
-                        terms.append(row[0].strip())
-                        
-            print(f"Se cargaron {len(terms)} términos desde {filepath}")
-            return terms
-        except Exception as e:
-            print(f"Error al cargar términos desde {filepath}: {str(e)}")
-            return []
+        return list(load_domain_terms(filepath))
     
     def _run_searches(self, domain1_terms: List[str], domain2_terms: List[str], 
                       domain3_terms: Optional[List[str]] = None, max_results: int = 100,
                       year_start: Optional[int] = None, year_end: Optional[int] = None,
                       email: Optional[str] = None) -> None:
-        """Run searches in all academic sources."""
+        """Run searches in all academic sources concurrently."""
         print("\n====== INICIANDO BÚSQUEDAS EN FUENTES ACADÉMICAS ======\n")
         
         # Ensure base directory exists
         os.makedirs("outputs", exist_ok=True)
         
-        # Run Crossref search
-        print("\n----- Búsqueda en Crossref -----\n")
+        search_args = {
+            "domain1_terms": domain1_terms,
+            "domain2_terms": domain2_terms,
+            "domain3_terms": domain3_terms,
+            "max_results": max_results,
+            "year_start": year_start,
+            "year_end": year_end,
+            "email": email
+        }
+        
+        searches = [("Crossref", self._do_crossref)]
+        # Science Direct only runs if an API key exists; without one its
+        # backend is never submitted, so it is never imported either
+        if os.path.exists(SCIENCEDIRECT_APIKEY_FILE):
+            searches.append(("Science Direct", self._do_sciencedirect))
+        searches.append(("Semantic Scholar", self._do_semantic_scholar))
+        searches.append(("Google Scholar", self._do_google_scholar))
+        
+        # Each source is network-bound, so run them side by side; every wrapper
+        # imports its backend inside the worker thread, so module import time
+        # overlaps with the other searches, and handles its own errors so one
+        # failing source doesn't cancel the rest
+        with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+            futures = {}
+            for name, search in searches:
+                print(f"\n----- Búsqueda en {name} -----\n")
+                futures[executor.submit(search, **search_args)] = name
+            
+            for future in as_completed(futures):
+                future.result()
+                print(f"\n----- Búsqueda en {futures[future]} finalizada -----\n")
+    
+    def _do_crossref(self, domain1_terms: List[str], domain2_terms: List[str],
+                     domain3_terms: Optional[List[str]], max_results: int,
+                     year_start: Optional[int], year_end: Optional[int],
+                     email: Optional[str]) -> None:
+        """Run the Crossref search."""
         try:
             from crossref_search import run_crossref_search
             run_crossref_search(
@@ -164,29 +325,33 @@ class SearchPhase(PhaseRunner):
             )
         except Exception as e:
             print(f"Error en búsqueda Crossref: {str(e)}")
-        
-        # Run Science Direct search if API key exists
-        sciencedirect_apikey_file = os.path.join("secrets", "sciencedirect_apikey.txt")
-        if os.path.exists(sciencedirect_apikey_file):
-            print("\n----- Búsqueda en Science Direct -----\n")
-            try:
-                from science_direct_search import run_science_direct_search
-                run_science_direct_search(
-                    domain1_terms=domain1_terms,
-                    domain2_terms=domain2_terms,
-                    domain3_terms=domain3_terms,
-                    apikey_file=sciencedirect_apikey_file,
-                    results_file="sciencedirect_results.json",  # Let script handle file path
-                    abstracts_file="sciencedirect_abstracts.json",
-                    max_results=max_results,
-                    fetch_details=True,
-                    year_range=(year_start, year_end) if year_start or year_end else None
-                )
-            except Exception as e:
-                print(f"Error en búsqueda Science Direct: {str(e)}")
-        
-        # Run Semantic Scholar search
-        print("\n----- Búsqueda en Semantic Scholar -----\n")
+    
+    def _do_sciencedirect(self, domain1_terms: List[str], domain2_terms: List[str],
+                          domain3_terms: Optional[List[str]], max_results: int,
+                          year_start: Optional[int], year_end: Optional[int],
+                          email: Optional[str]) -> None:
+        """Run the Science Direct search."""
+        try:
+            from science_direct_search import run_science_direct_search
+            run_science_direct_search(
+                domain1_terms=domain1_terms,
+                domain2_terms=domain2_terms,
+                domain3_terms=domain3_terms,
+                apikey_file=SCIENCEDIRECT_APIKEY_FILE,
+                results_file="sciencedirect_results.json",  # Let script handle file path
+                abstracts_file="sciencedirect_abstracts.json",
+                max_results=max_results,
+                fetch_details=True,
+                year_range=(year_start, year_end) if year_start or year_end else None
+            )
+        except Exception as e:
+            print(f"Error en búsqueda Science Direct: {str(e)}")
+    
+    def _do_semantic_scholar(self, domain1_terms: List[str], domain2_terms: List[str],
+                             domain3_terms: Optional[List[str]], max_results: int,
+                             year_start: Optional[int], year_end: Optional[int],
+                             email: Optional[str]) -> None:
+        """Run the Semantic Scholar search."""
         try:
             from semantic_scholar_search import run_semantic_scholar_search
             run_semantic_scholar_search(
@@ -201,9 +366,12 @@ class SearchPhase(PhaseRunner):
             )
         except Exception as e:
             print(f"Error en búsqueda Semantic Scholar: {str(e)}")
-        
-        # Run Google Scholar search
-        print("\n----- Búsqueda en Google Scholar -----\n")
+    
+    def _do_google_scholar(self, domain1_terms: List[str], domain2_terms: List[str],
+                           domain3_terms: Optional[List[str]], max_results: int,
+                           year_start: Optional[int], year_end: Optional[int],
+                           email: Optional[str]) -> None:
+        """Run the Google Scholar search."""
         try:
             from google_scholar_scraper import run_google_scholar_search
             run_google_scholar_search(
@@ -241,13 +409,17 @@ class SearchPhase(PhaseRunner):
             print(f"Error durante la integración: {str(e)}")
 
 class AnalysisPhase(PhaseRunner):
+    _SCRIPT: ClassVar[str] = "analysis_generator.py"
+    # Reads the classified results and, directly, the abstracts written by the search
+    dependencies: ClassVar[Tuple[str, ...]] = ("ClassificationPhase", "SearchPhase")
+
     def __init__(self, config: PipelineConfig):
         self.config = config
 
     def get_command(self) -> List[str]:
         cmd = [
-            sys.executable,
-            "analysis_generator.py",
+            self._PY,
+            self._SCRIPT,
             "--classified-file", os.path.join("outputs", "classified_results.json"),
             "--abstracts-file", os.path.join("outputs", "integrated_abstracts.json"),
             "--domain-stats-file", os.path.join("outputs", "domain_statistics.csv"),
@@ -259,13 +431,16 @@ class AnalysisPhase(PhaseRunner):
         return "Análisis y generación de visualizaciones"
 
 class ReportPhase(PhaseRunner):
+    _SCRIPT: ClassVar[str] = "report_generator.py"
+    dependencies: ClassVar[Tuple[str, ...]] = ("AnalysisPhase",)
+
     def __init__(self, config: PipelineConfig):
         self.config = config
 
     def get_command(self) -> List[str]:
         cmd = [
-            sys.executable,
-            "report_generator.py",
+            self._PY,
+            self._SCRIPT,
             "--stats-file", os.path.join(self.config.figures_dir, "statistics.json"),
             "--figures-dir", self.config.figures_dir,
             "--output-file", self.config.report_file
@@ -284,14 +459,18 @@ class ReportPhase(PhaseRunner):
 
 class ClassificationPhase(PhaseRunner):
     """Phase runner for article classification using NLP models."""
+    _SCRIPT: ClassVar[str] = "nlp_classifier_anthropic.py"
+    _BATCH_SIZE: ClassVar[int] = 5
+    dependencies: ClassVar[Tuple[str, ...]] = ("DomainAnalysisPhase",)
+
     def __init__(self, config: PipelineConfig):
         self.config = config
         
     def get_command(self) -> List[str]:
         """For backward compatibility with subprocess execution"""
         cmd = [
-            sys.executable,
-            "nlp_classifier_anthropic.py",
+            self._PY,
+            self._SCRIPT,
             "--input", os.path.join("outputs", "domain_analyzed_results.json"),
             "--output", os.path.join("outputs", "classified_results.json"),
             "--questions", "questions.json",
@@ -308,6 +487,13 @@ class ClassificationPhase(PhaseRunner):
         try:
             print(f"\n===== EJECUTANDO: {self.get_description()} =====")
             
+            inputs = [os.path.join("outputs", "domain_analyzed_results.json"), "questions.json"]
+            outputs = [os.path.join("outputs", "classified_results.json")]
+            settings = {"batch_size": self._BATCH_SIZE}
+            if self._inputs_unchanged(inputs, outputs, settings):
+                print("Los resultados clasificados están al día; se omite la fase.")
+                return True
+            
             # Import classification module
             from nlp_classifier_anthropic import classify_articles, progress_callback
             
@@ -317,11 +503,13 @@ class ClassificationPhase(PhaseRunner):
                 questions_file="questions.json",
                 output_file=os.path.join("outputs", "classified_results.json"),
                 api_key_file=os.path.join("secrets", "anthropic-apikey"),
-                batch_size=5,
+                batch_size=self._BATCH_SIZE,
                 sequential=True,
                 callback=progress_callback
             )
             
+            if success:
+                self._mark_outputs_current(outputs, settings)
             return success
             
         except Exception as e:
@@ -331,14 +519,17 @@ class ClassificationPhase(PhaseRunner):
 
 class DomainAnalysisPhase(PhaseRunner):
     """Phase runner for domain analysis. Directly implements the domain analysis logic."""
+    _SCRIPT: ClassVar[str] = "domain_analysis.py"
+    dependencies: ClassVar[Tuple[str, ...]] = ("SearchPhase",)
+
     def __init__(self, config: PipelineConfig):
         self.config = config
         
     def get_command(self) -> List[str]:
         """For backward compatibility with subprocess execution"""
         cmd = [
-            sys.executable,
-            "domain_analysis.py",
+            self._PY,
+            self._SCRIPT,
             "--input-file", os.path.join("outputs", "integrated_results.json"),
             "--output-results", os.path.join("outputs", "domain_analyzed_results.json"),
             "--output-stats", os.path.join("outputs", "domain_statistics.csv"),
@@ -370,17 +561,32 @@ class DomainAnalysisPhase(PhaseRunner):
             # Set default domain names if not specified
             domain_names = ["IA", "Pronóstico", "Pesquerías"]
             
-            # Run domain analysis
-            self._run_domain_analysis(
-                input_file=os.path.join("outputs", "integrated_results.json"),
-                output_results_file=os.path.join("outputs", "domain_analyzed_results.json"),
-                output_stats_file=os.path.join("outputs", "domain_statistics.csv"),
+            input_file = os.path.join("outputs", "integrated_results.json")
+            outputs = [
+                os.path.join("outputs", "domain_analyzed_results.json"),
+                os.path.join("outputs", "domain_statistics.csv")
+            ]
+            settings = {
+                "domain_terms": [domain1_terms, domain2_terms, domain3_terms],
+                "domain_names": domain_names
+            }
+            if self._inputs_unchanged([input_file], outputs, settings):
+                print("El análisis de dominios está al día; se omite la fase.")
+                return True
+            
+            # Run domain analysis; outputs are only marked current if it fully succeeded
+            completed = self._run_domain_analysis(
+                input_file=input_file,
+                output_results_file=outputs[0],
+                output_stats_file=outputs[1],
                 domain1_terms=domain1_terms,
                 domain2_terms=domain2_terms,
                 domain3_terms=domain3_terms,
                 domain_names=domain_names
             )
             
+            if completed:
+                self._mark_outputs_current(outputs, settings)
             return True
             
         except Exception as e:
@@ -389,19 +595,7 @@ class DomainAnalysisPhase(PhaseRunner):
     
     def _load_domain_terms(self, filepath: str) -> List[str]:
         """Load domain terms from a CSV file."""
-        terms = []
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if row and row[0].strip():
-                        terms.append(row[0].strip())
-                        
-            print(f"Se cargaron {len(terms)} términos desde {filepath}")
-            return terms
-        except Exception as e:
-            print(f"Error al cargar términos desde {filepath}: {str(e)}")
-            return []
+        return list(load_domain_terms(filepath))
     
     def _run_domain_analysis(
         self,
@@ -412,8 +606,8 @@ class DomainAnalysisPhase(PhaseRunner):
         domain2_terms: List[str],
         domain3_terms: List[str] = None,
         domain_names: List[str] = None
-    ) -> None:
-        """Execute domain analysis."""
+    ) -> bool:
+        """Execute domain analysis. Returns True if both output files were written."""
         try:
             print(f"Iniciando análisis de dominio...")
             
@@ -422,7 +616,13 @@ class DomainAnalysisPhase(PhaseRunner):
             
             if not results:
                 print("No se encontraron resultados para analizar.")
-                return
+                return False
+            
+            # Drop articles repeated across sources before analyzing them
+            total_loaded = len(results)
+            results = self._deduplicate_results(results)
+            if len(results) < total_loaded:
+                print(f"Se eliminaron {total_loaded - len(results)} artículos duplicados.")
             
             # Prepare domain list
             domain_terms_list = [domain1_terms, domain2_terms]
@@ -436,15 +636,19 @@ class DomainAnalysisPhase(PhaseRunner):
                 domain_names.extend([f"Dominio{i+1}" for i in range(len(domain_names), len(domain_terms_list))])
             
             # Analyze domains
-            self._analyze_domains(results, domain_terms_list, domain_names)
+            results, stats = self._analyze_domains(results, domain_terms_list, domain_names)
             
             # Save updated results
-            self._save_updated_results(results, output_results_file)
+            saved_results = self._save_updated_results(results, output_results_file)
             
             # Save statistics to CSV
-            self._save_stats_csv(stats, output_stats_file)
+            saved_stats = self._save_stats_csv(stats, output_stats_file)
+            
+            if not (saved_results and saved_stats):
+                return False
             
             print(f"Análisis de dominio completado correctamente.")
+            return True
             
         except Exception as e:
             print(f"Error durante el análisis de dominio: {str(e)}")
@@ -453,94 +657,160 @@ class DomainAnalysisPhase(PhaseRunner):
     def _load_integrated_results(self, filepath: str) -> List[Dict[Any, Any]]:
         """Load integrated results from a JSON file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                results = json.load(file)
-                print(f"Se cargaron {len(results)} artículos del archivo {filepath}")
-                return results
+            if ijson is not None:
+                # Parse one article at a time so the raw file text is never held whole
+                with open(filepath, 'rb') as file:
+                    results = list(ijson.items(file, 'item', use_float=True))
+            else:
+                with open(filepath, 'r', encoding='utf-8') as file:
+                    results = json.load(file)
+            print(f"Se cargaron {len(results)} artículos del archivo {filepath}")
+            return results
         except Exception as e:
             print(f"Error al cargar los resultados: {str(e)}")
             return []
     
+    def _deduplicate_results(self, results: List[Dict[Any, Any]]) -> List[Dict[Any, Any]]:
+        """Keep the first occurrence of each article, keyed by DOI or normalized title.
+
+        Integrated results are ordered by source priority, so the record kept is
+        the one from the highest-priority source. Articles with neither a DOI
+        nor a title are always kept.
+        """
+        seen = set()
+        unique = []
+        for article in results:
+            doi = (article.get("doi") or "").strip().lower()
+            key = doi or self._normalize_text(article.get("title", ""))[:120]
+            if key:
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique.append(article)
+        return unique
+    
     def _normalize_text(self, text: str) -> str:
         """Normalize text for term analysis."""
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and replace with spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Remove numbers
-        text = re.sub(r'\d+', ' ', text)
-        
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Lowercase, turn special characters and digits into spaces, collapse spaces
+        return ' '.join(text.lower().translate(_NORMALIZE_TABLE).split())
     
-    def _check_domain_presence(self, title: str, domain_terms: List[str]) -> bool:
-        """Check if any domain term is present in the title."""
-        normalized_title = self._normalize_text(title)
-        
-        # Check each domain term
+    def _prepare_domain(self, domain_terms: List[str]) -> Tuple[Optional[re.Pattern], List[Tuple[str, str, Optional[re.Pattern]]]]:
+        """Normalize a domain's terms once and compile their matchers.
+
+        Returns a fused matcher for the whole domain plus, for every term, its
+        normalized form and a word-bounded pattern (None for compound terms,
+        which are matched as exact substrings).
+        """
+        term_matchers = []
         for term in domain_terms:
             normalized_term = self._normalize_text(term)
-            
-            # For compound terms (more than one word), check for exact match
             if len(normalized_term.split()) > 1:
-                if normalized_term in normalized_title:
-                    return True
+                term_matchers.append((term, normalized_term, None))
             else:
-                # For single-word terms, check for whole word
-                pattern = r'\b' + re.escape(normalized_term) + r'\b'
-                if re.search(pattern, normalized_title):
-                    return True
+                term_matchers.append((term, normalized_term, re.compile(r'\b' + re.escape(normalized_term) + r'\b')))
+        
+        single_words = [norm for _, norm, pattern in term_matchers if pattern is not None]
+        multiwords = [norm for _, norm, pattern in term_matchers if pattern is None]
         
-        return False
+        # Single-word terms must match a whole word; compound terms (more than
+        # one word) match as exact substrings. One alternation scans the title once.
+        alternatives = []
+        if single_words:
+            alternatives.append(r'\b(?:' + '|'.join(re.escape(w) for w in single_words) + r')\b')
+        alternatives.extend(re.escape(m) for m in multiwords)
+        
+        matcher = re.compile('|'.join(alternatives)) if alternatives else None
+        return matcher, term_matchers
+    
+    def _check_domain_presence(self, normalized_title: str, prepared_domain: Tuple[Optional[re.Pattern], List[Tuple[str, str, Optional[re.Pattern]]]]) -> bool:
+        """Check if any domain term is present in an already normalized title."""
+        matcher, _ = prepared_domain
+        return matcher is not None and matcher.search(normalized_title) is not None
+    
+    def _match_domain_terms(self, normalized_title: str, prepared_domain: Tuple[Optional[re.Pattern], List[Tuple[str, str, Optional[re.Pattern]]]]) -> List[str]:
+        """Return every domain term found in an already normalized title."""
+        matched = []
+        for term, normalized_term, pattern in prepared_domain[1]:
+            if pattern is None:
+                found = normalized_term in normalized_title
+            else:
+                found = pattern.search(normalized_title) is not None
+            if found:
+                matched.append(term)
+        return matched
+    
+    def _analyze_titles(self, titles: List[str], prepared_domains: List[Tuple[Optional[re.Pattern], List[Tuple[str, str, Optional[re.Pattern]]]]]) -> Tuple[List[int], List[Dict[str, int]]]:
+        """Compute each title's domain-membership bitmask and count matched terms per domain."""
+        masks = []
+        domain_term_counters = [defaultdict(int) for _ in prepared_domains]
+        
+        for title in titles:
+            normalized_title = self._normalize_text(title)
+            mask = 0
+            
+            for i, prepared_domain in enumerate(prepared_domains):
+                # One fused scan rules out most titles before testing terms individually
+                if not self._check_domain_presence(normalized_title, prepared_domain):
+                    continue
+                
+                # The title belongs to the domain if any of its terms matched
+                matched_terms = self._match_domain_terms(normalized_title, prepared_domain)
+                if matched_terms:
+                    mask |= 1 << i
+                    for term in matched_terms:
+                        domain_term_counters[i][term] += 1
+            
+            masks.append(mask)
+        
+        return masks, domain_term_counters
     
     def _analyze_domains(self, results: List[Dict[Any, Any]], domain_terms_list: List[List[str]], domain_names: List[str]) -> Tuple[List[Dict[Any, Any]], Dict[str, Any]]:
         """Analyze domain term presence in article titles."""
-        # Initialize counters
         total_articles = len(results)
-        domain_counters = [0] * len(domain_terms_list)
-        domain_term_counters = [defaultdict(int) for _ in range(len(domain_terms_list))]
         
         # Verify domains and names match
         if len(domain_terms_list) != len(domain_names):
             raise ValueError("The number of domains does not match the number of domain names")
         
-        # Analyze each article
-        for article in results:
-            title = article.get("title", "")
-            
-            # Check and update each domain
-            for i, (domain_terms, domain_name) in enumerate(zip(domain_terms_list, domain_names)):
-                # Check if article belongs to current domain
-                in_domain = self._check_domain_presence(title, domain_terms)
-                
-                # Add binary value to article
-                domain_key = f"in_{domain_name.lower().replace(' ', '_')}_domain"
-                article[domain_key] = 1 if in_domain else 0
-                
-                # Update counters
-                if in_domain:
-                    domain_counters[i] += 1
-                    
-                    # Count which specific terms appear
-                    for term in domain_terms:
-                        normalized_term = self._normalize_text(term)
-                        normalized_title = self._normalize_text(title)
-                        
-                        # Check term presence
-                        if len(normalized_term.split()) > 1:
-                            if normalized_term in normalized_title:
-                                domain_term_counters[i][term] += 1
-                        else:
-                            pattern = r'\b' + re.escape(normalized_term) + r'\b'
-                            if re.search(pattern, normalized_title):
-                                domain_term_counters[i][term] += 1
+        # Normalize terms and compile matchers once per domain
+        prepared_domains = [self._prepare_domain(domain_terms) for domain_terms in domain_terms_list]
+        
+        domain_keys = [f"in_{domain_name.lower().replace(' ', '_')}_domain" for domain_name in domain_names]
+        titles = [article.get("title", "") for article in results]
+        
+        # Matching is CPU-bound, so large result sets are split across processes
+        workers = os.cpu_count() or 1
+        if total_articles >= PARALLEL_MIN_ARTICLES and workers > 1:
+            chunk_size = -(-total_articles // workers)
+            chunks = [titles[k:k + chunk_size] for k in range(0, total_articles, chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(self._analyze_titles, chunks, repeat(prepared_domains)))
+        else:
+            partials = [self._analyze_titles(titles, prepared_domains)]
+        
+        # Merge partial results in chunk order so term tie order matches a sequential run
+        masks = []
+        domain_term_counters = [defaultdict(int) for _ in domain_keys]
+        for chunk_masks, chunk_term_counters in partials:
+            masks.extend(chunk_masks)
+            for merged, partial in zip(domain_term_counters, chunk_term_counters):
+                for term, count in partial.items():
+                    merged[term] += count
+        
+        # Count articles per domain-membership bitmask (bit i set = in domain i)
+        mask_counts = Counter(masks)
+        domain_counters = [
+            sum(count for mask, count in mask_counts.items() if mask & (1 << i))
+            for i in range(len(domain_keys))
+        ]
+        
+        # Add binary value per domain to each article
+        for article, mask in zip(results, masks):
+            for i, domain_key in enumerate(domain_keys):
+                article[domain_key] = (mask >> i) & 1
         
         # Calculate statistics
         stats = {
@@ -550,7 +820,7 @@ class DomainAnalysisPhase(PhaseRunner):
         
         for i, (domain_name, counter, term_counter) in enumerate(zip(domain_names, domain_counters, domain_term_counters)):
             # Sort terms by frequency
-            sorted_terms = sorted(term_counter.items(), key=lambda x: x[1], reverse=True)
+            sorted_terms = sorted(term_counter.items(), key=itemgetter(1), reverse=True)
             
             domain_stats = {
                 "name": domain_name,
@@ -568,11 +838,8 @@ class DomainAnalysisPhase(PhaseRunner):
         for i in range(len(domain_names)):
             for j in range(i+1, len(domain_names)):
                 # Count articles belonging to both domains
-                intersection_count = sum(
-                    1 for article in results 
-                    if article.get(f"in_{domain_names[i].lower().replace(' ', '_')}_domain") == 1 
-                    and article.get(f"in_{domain_names[j].lower().replace(' ', '_')}_domain") == 1
-                )
+                pair_mask = (1 << i) | (1 << j)
+                intersection_count = sum(count for mask, count in mask_counts.items() if mask & pair_mask == pair_mask)
                 
                 intersection_key = f"{domain_names[i]}_{domain_names[j]}"
                 stats["intersections"][intersection_key] = {
@@ -582,10 +849,7 @@ class DomainAnalysisPhase(PhaseRunner):
         
         # Articles belonging to all domains
         if len(domain_names) > 2:
-            all_domains_count = sum(
-                1 for article in results 
-                if all(article.get(f"in_{domain.lower().replace(' ', '_')}_domain") == 1 for domain in domain_names)
-            )
+            all_domains_count = mask_counts[(1 << len(domain_names)) - 1]
             
             stats["intersections"]["all_domains"] = {
                 "count": all_domains_count,
@@ -594,68 +858,74 @@ class DomainAnalysisPhase(PhaseRunner):
         
         return results, stats
     
-    def _save_updated_results(self, results: List[Dict[Any, Any]], filepath: str) -> None:
-        """Save updated results to a JSON file."""
+    def _save_updated_results(self, results: List[Dict[Any, Any]], filepath: str) -> bool:
+        """Save updated results to a JSON file. Returns False if writing failed."""
         try:
+            # One compact article per line: without indent json uses its C encoder,
+            # and writing item by item avoids building the whole document in memory
             with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(results, file, ensure_ascii=False, indent=4)
+                file.write("[")
+                for index, article in enumerate(results):
+                    file.write(",\n" if index else "\n")
+                    file.write(json.dumps(article, ensure_ascii=False))
+                file.write("\n]\n" if results else "]\n")
             print(f"Resultados actualizados guardados en {filepath}")
+            return True
         except Exception as e:
             print(f"Error al guardar los resultados actualizados: {str(e)}")
+            return False
     
-    def _save_stats_csv(self, stats: Dict[str, Any], filepath: str) -> None:
-        """Save statistics to a CSV file."""
+    def _save_stats_csv(self, stats: Dict[str, Any], filepath: str) -> bool:
+        """Save statistics to a CSV file. Returns False if writing failed."""
         try:
+            # Header
+            rows = [
+                ["Estadísticas de Dominio"],
+                ["Total de artículos analizados", stats["total_articles"]],
+                [],
+            ]
+            
+            # Statistics by domain
+            rows.append(["Estadísticas por Dominio"])
+            rows.append(["Dominio", "Artículos", "Porcentaje"])
+            rows.extend([domain["name"], domain["count"], f"{domain['percentage']}%"] for domain in stats["domains"])
+            rows.append([])
+            
+            # Intersections
+            rows.append(["Intersecciones entre Dominios"])
+            rows.append(["Dominios", "Artículos", "Porcentaje"])
+            rows.extend([key.replace("_", " & "), value["count"], f"{value['percentage']}%"] for key, value in stats["intersections"].items())
+            rows.append([])
+            
+            # Most frequent terms by domain
+            for domain in stats["domains"]:
+                rows.append([f"Términos más frecuentes en {domain['name']}"])
+                rows.append(["Término", "Frecuencia"])
+                rows.extend([term, count] for term, count in domain["terms"])
+                rows.append([])
+            
             with open(filepath, 'w', encoding='utf-8', newline='') as file:
-                writer = csv.writer(file)
-                
-                # Write header
-                writer.writerow(["Estadísticas de Dominio"])
-                writer.writerow(["Total de artículos analizados", stats["total_articles"]])
-                writer.writerow([])
-                
-                # Write statistics by domain
-                writer.writerow(["Estadísticas por Dominio"])
-                writer.writerow(["Dominio", "Artículos", "Porcentaje"])
-                
-                for domain in stats["domains"]:
-                    writer.writerow([domain["name"], domain["count"], f"{domain['percentage']}%"])
-                
-                writer.writerow([])
-                
-                # Write intersections
-                writer.writerow(["Intersecciones entre Dominios"])
-                writer.writerow(["Dominios", "Artículos", "Porcentaje"])
-                
-                for key, value in stats["intersections"].items():
-                    writer.writerow([key.replace("_", " & "), value["count"], f"{value['percentage']}%"])
-                
-                writer.writerow([])
-                
-                # Write most frequent terms by domain
-                for domain in stats["domains"]:
-                    writer.writerow([f"Términos más frecuentes en {domain['name']}"])
-                    writer.writerow(["Término", "Frecuencia"])
-                    
-                    for term, count in domain["terms"]:
-                        writer.writerow([term, count])
-                    
-                    writer.writerow([])
+                csv.writer(file).writerows(rows)
             
             print(f"Estadísticas guardadas en {filepath}")
+            return True
         except Exception as e:
             print(f"Error al guardar las estadísticas en CSV: {str(e)}")
+            return False
 
 class TableExportPhase(PhaseRunner):
     """Phase runner for exporting article tables."""
+    _SCRIPT: ClassVar[str] = "export_articles_table.py"
+    dependencies: ClassVar[Tuple[str, ...]] = ("ClassificationPhase",)
+
     def __init__(self, config: PipelineConfig):
         self.config = config
 
     def get_command(self) -> List[str]:
         """For backward compatibility with subprocess execution"""
         cmd = [
-            sys.executable,
-            "export_articles_table.py",
+            self._PY,
+            self._SCRIPT,
             "--input", os.path.join("outputs", "classified_results.json"),
             "--output", self.config.table_file,
             "--format", self.config.table_format
@@ -670,15 +940,23 @@ class TableExportPhase(PhaseRunner):
         try:
             print(f"\n===== EJECUTANDO: {self.get_description()} =====")
             
+            input_file = os.path.join("outputs", "classified_results.json")
+            outputs = [self.config.table_file]
+            settings = {"format": self.config.table_format}
+            if self._inputs_unchanged([input_file], outputs, settings):
+                print(f"La tabla de artículos está al día: {self.config.table_file}")
+                return True
+            
             from export_articles_table import export_articles_table
             
             success = export_articles_table(
-                input_file=os.path.join("outputs", "classified_results.json"),
+                input_file=input_file,
                 output_file=self.config.table_file,
                 format=self.config.table_format
             )
             
             if success:
+                self._mark_outputs_current(outputs, settings)
                 print(f"Tabla de artículos exportada exitosamente a: {self.config.table_file}")
             
             return success
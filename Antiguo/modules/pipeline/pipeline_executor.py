@@ -1,59 +1,115 @@
-from datetime import datetime
 import os
-from typing import List, Dict, Any
+import time
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Set, Tuple
 from config.config_manager import PipelineConfig
-from pipeline.phase_runner import PhaseRunner, SearchPhase, AnalysisPhase, ReportPhase, DomainAnalysisPhase, ClassificationPhase,  TableExportPhase  
 from .logger import Logger
 
+if TYPE_CHECKING:
+    from pipeline.phase_runner import PhaseRunner
+
+_required_fields = attrgetter("domain1", "domain2", "figures_dir")
+
+# Phase class names in execution order, each with the condition that selects it
+_PHASE_SPECS: List[Tuple[str, Callable[[PipelineConfig], bool]]] = [
+    # Search phase includes the initial data collection
+    ("SearchPhase", lambda c: not (c.only_analysis or c.only_report)),
+    # Domain analysis and NLP classification follow the search
+    ("DomainAnalysisPhase", lambda c: not (c.only_analysis or c.only_report or c.skip_domain_analysis)),
+    ("ClassificationPhase", lambda c: not (c.only_analysis or c.only_report or c.skip_domain_analysis)),
+    ("AnalysisPhase", lambda c: not (c.only_search or c.only_report)),
+    ("ReportPhase", lambda c: not (c.only_search or c.only_analysis)),
+    ("TableExportPhase", lambda c: not c.skip_table),
+]
+
+# Order used when no specific phase is selected, and the flag that skips each phase
+_ALL_PHASES = (
+    "SearchPhase", "DomainAnalysisPhase", "ClassificationPhase",
+    "AnalysisPhase", "TableExportPhase", "ReportPhase"
+)
+_SKIP_FLAGS = {
+    "DomainAnalysisPhase": "skip_domain_analysis",
+    "ClassificationPhase": "skip_classification",
+    "TableExportPhase": "skip_table"
+}
+
 class PipelineExecutor:
     def __init__(self, config: PipelineConfig):
         self.config = config
-        self.logger = Logger()
+        self.logger = Logger(durable_summary=getattr(config, 'durable_summary', False),
+                             echo_to_stdout=True,
+                             events_file=os.path.join("outputs", "pipeline_execution.ndjson"))
         
     def execute(self) -> bool:
         """Execute all pipeline phases according to configuration."""
         if not self.validate_config():
             self.logger.log_error("Invalid configuration")
+            self.logger.close()
             return False
 
-        self.logger.start_pipeline()
-        success = True
+        with self.logger:
+            success = True
+            phases = []
+            completed = 0
 
-        try:
-            phases = self._get_phases_to_run()
-            
-            for phase in phases:
-                phase_name = phase.get_description()
-                self.logger.start_phase(phase_name)
-                
-                # Ensure each phase is executed only once
-                phase_success = phase.run()
-                details = {"phase": phase_name}
-                
-                if not phase_success:
-                    success = False
-                    details["error"] = "Phase execution failed"
-                
-                self.logger.end_phase(phase_success, details)
+            try:
+                phases = self._get_phases_to_run()
                 
-                if not phase_success:
-                    break  # Stop execution if a phase fails
+                # Phases in the same level don't depend on each other, so they run side by side
+                for level in self._group_into_levels(phases):
+                    with ThreadPoolExecutor(max_workers=len(level)) as executor:
+                        outcomes = list(executor.map(self._run_phase, level))
+                    
+                    completed += sum(outcomes)
+                    if not all(outcomes):
+                        success = False
+                        break  # Stop execution if a phase fails
 
-        except Exception as e:
-            self.logger.log_error(e)
-            success = False
+            except Exception as e:
+                self.logger.log_error(e)
+                success = False
+            
+            # Save execution summary
+            stats = {
+                "total_phases": len(phases),
+                "completed": completed,
+                "configuration": self.config_summary
+            }
+            
+            self.logger.end_pipeline(success, stats)
+            self.logger.save_summary("pipeline_execution.json")
         
-        # Save execution summary
-        stats = {
-            "total_phases": len(phases),
-            "completed": len([p for p in phases if p.run()]),  # Avoid re-running phases here
-            "configuration": self._get_config_summary()
-        }
+        return success
+
+    def _run_phase(self, phase: "PhaseRunner") -> bool:
+        """Run a single phase, logging its start and end."""
+        phase_name = phase.get_description()
+        self.logger.start_phase(phase_name)
         
-        self.logger.end_pipeline(success, stats)
-        self.logger.save_summary("pipeline_execution.json")
+        # Retry transient failures (e.g. API errors) with exponential backoff. Off
+        # unless the config sets retry_count: re-running a phase can repeat paid API calls
+        retry_count = max(1, getattr(self.config, 'retry_count', 1))
+        retry_backoff = getattr(self.config, 'retry_backoff', 2.0)
+        for attempt in range(retry_count):
+            phase_success = phase.run()
+            if phase_success or attempt == retry_count - 1:
+                break
+            delay = retry_backoff ** attempt
+            self.logger.log_warning(f"{phase_name} failed, retrying in {delay:.1f} seconds "
+                                    f"(attempt {attempt + 2} of {retry_count})")
+            time.sleep(delay)
         
-        return success
+        details = {"phase": phase_name}
+        if attempt:
+            details["attempts"] = attempt + 1
+        
+        if not phase_success:
+            details["error"] = "Phase execution failed"
+        
+        self.logger.end_phase(phase_success, details, phase_name)
+        return phase_success
 
     def validate_config(self) -> bool:
         """Validate pipeline configuration."""
@@ -61,74 +117,102 @@ class PipelineExecutor:
             self.logger.log_error("No configuration provided")
             return False
             
-        required_fields = ["domain1", "domain2", "figures_dir"]
-        for field in required_fields:
-            if not hasattr(self.config, field):
-                self.logger.log_error(f"Missing required config field: {field}")
-                return False
+        try:
+            domain1, domain2, _ = _required_fields(self.config)
+        except AttributeError as e:
+            self.logger.log_error(f"Missing required config field: {e.name}")
+            return False
                 
         # Validate input files exist
-        if not os.path.exists(self.config.domain1):
-            self.logger.log_error(f"Domain1 file not found: {self.config.domain1}")
+        domain1_found, domain2_found = self._input_files_exist(domain1, domain2)
+        if not domain1_found:
+            self.logger.log_error(f"Domain1 file not found: {domain1}")
             return False
             
-        if not os.path.exists(self.config.domain2):
-            self.logger.log_error(f"Domain2 file not found: {self.config.domain2}")
+        if not domain2_found:
+            self.logger.log_error(f"Domain2 file not found: {domain2}")
             return False
             
         return True
 
-    def _get_phases_to_run(self) -> List[PhaseRunner]:
+    def _input_files_exist(self, *paths: str) -> Tuple[bool, ...]:
+        """Check which paths exist, listing their directory once when they share one."""
+        directories = {os.path.dirname(path) for path in paths}
+        if len(directories) > 1:
+            return tuple(os.path.exists(path) for path in paths)
+        
+        try:
+            with os.scandir(directories.pop() or ".") as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        # The listing is case-sensitive; on case-insensitive file systems a name
+        # missing from it may still exist, so those fall back to os.path.exists
+        return tuple(os.path.basename(path) in names or os.path.exists(path) for path in paths)
+
+    def _get_phases_to_run(self) -> List["PhaseRunner"]:
         """Determine which phases to run based on configuration."""
-        phases = []
+        return list(self._phases_to_run)
+
+    @cached_property
+    def _phases_to_run(self) -> List["PhaseRunner"]:
+        """Phases selected by the configuration, built once per executor."""
+        # Imported here so loading the executor doesn't pull in the phase runners
+        from pipeline import phase_runner
         
         # Only add phases based on configuration
-        if not (self.config.only_analysis or self.config.only_report):
-            # Search phase includes the initial data collection
-            phases.append(SearchPhase(self.config))
-            
-            # Domain analysis is now a separate phase in the new architecture
-            if not self.config.skip_domain_analysis:
-                phases.append(DomainAnalysisPhase(self.config))
-                phases.append(ClassificationPhase(self.config))
-            # Classification phase using NLP (Claude)
-        if not (self.config.only_search or self.config.only_report):
-            phases.append(AnalysisPhase(self.config))
-            
-        if not (self.config.only_search or self.config.only_analysis):
-            phases.append(ReportPhase(self.config))
-        
-        # Add table export phase if not skipped
-        if not self.config.skip_table:
-            phases.append(TableExportPhase(self.config))
+        phases = [
+            getattr(phase_runner, name)(self.config)
+            for name, selected in _PHASE_SPECS
+            if selected(self.config)
+        ]
             
-        # If no specific phase is requested, run all
+        # If no specific phase is requested, run all except the skipped ones
         if not phases:
-            all_phases = [
-                SearchPhase(self.config),
-                DomainAnalysisPhase(self.config),
-                ClassificationPhase(self.config),
-                AnalysisPhase(self.config),
-                TableExportPhase(self.config),
-                ReportPhase(self.config)
+            phases = [
+                getattr(phase_runner, name)(self.config)
+                for name in _ALL_PHASES
+                if not getattr(self.config, _SKIP_FLAGS.get(name, ""), False)
             ]
             
-            # Filter out phases that should be skipped
-            if self.config.skip_domain_analysis:
-                all_phases = [p for p in all_phases if not isinstance(p, DomainAnalysisPhase)]
-                
-            if self.config.skip_classification:
-                all_phases = [p for p in all_phases if not isinstance(p, ClassificationPhase)]
-                
-            if self.config.skip_table:
-                all_phases = [p for p in all_phases if not isinstance(p, TableExportPhase)]
-                
-            phases = all_phases
-            
         return phases
 
-    def _get_config_summary(self) -> Dict[str, Any]:
-        """Create a summary of the current configuration."""
+    def _group_into_levels(self, phases: List["PhaseRunner"]) -> List[List["PhaseRunner"]]:
+        """Group phases by dependency depth, keeping their order within each level.
+
+        Dependencies are followed through phases that were not selected, so a
+        phase still waits for the selected phases those would have waited for.
+        """
+        from pipeline import phase_runner
+        
+        depth = {}
+        levels: Dict[int, List["PhaseRunner"]] = {}
+        for phase in phases:
+            name = type(phase).__name__
+            required = self._selected_dependencies(phase.dependencies, depth, phase_runner)
+            depth[name] = 1 + max((depth[dep] for dep in required), default=0)
+            levels.setdefault(depth[name], []).append(phase)
+        return [levels[level] for level in sorted(levels)]
+
+    def _selected_dependencies(self, names: Tuple[str, ...], selected: Dict[str, int], module: Any) -> Set[str]:
+        """Return the selected phases reachable from names, walking through unselected ones."""
+        found = set()
+        visited = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+            if name in selected:
+                found.add(name)
+            else:
+                pending.extend(getattr(module, name).dependencies)
+        return found
+
+    @cached_property
+    def config_summary(self) -> Dict[str, Any]:
+        """Summary of the configuration, built once per executor."""
         return {
             "search_settings": {
                 "max_results": self.config.max_results,
@@ -0,0 +1,143 @@
+"""
+Tests para las fases del pipeline (pipeline/phase_runner.py).
+
+Cobertura:
+  - TestLoadIntegratedResults: carga del archivo de resultados integrados,
+                               con ijson o con json.load si no está instalado.
+  - TestRunDomainAnalysis    : análisis de dominios completo sobre un archivo
+                               de resultados integrados de prueba.
+
+Ejecución:
+    python -m unittest pipeline/tests/test_phase_runner.py
+    python -m unittest discover
+"""
+
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Resolución de rutas para que los imports funcionen desde cualquier directorio
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pipeline import phase_runner
+from pipeline.phase_runner import DomainAnalysisPhase
+
+
+class TestLoadIntegratedResults(unittest.TestCase):
+    """Pruebas para DomainAnalysisPhase._load_integrated_results."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.tmp_dir, "integrated_results.json")
+        self.phase = DomainAnalysisPhase(MagicMock())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _load(self, text: str) -> list:
+        with open(self.input_file, "w", encoding="utf-8") as file:
+            file.write(text)
+        with patch("builtins.print"):
+            return self.phase._load_integrated_results(self.input_file)
+
+    def test_loads_articles_without_ijson(self):
+        articles = [{"title": "Pesquerías [revisión]", "year": 2020, "score": 0.5}]
+        with patch.object(phase_runner, "ijson", None):
+            self.assertEqual(self._load(json.dumps(articles, ensure_ascii=False)), articles)
+
+    def test_malformed_file_returns_empty_list(self):
+        with patch.object(phase_runner, "ijson", None):
+            self.assertEqual(self._load("[1 2]"), [])
+
+    def test_missing_file_returns_empty_list(self):
+        with patch("builtins.print"):
+            self.assertEqual(self.phase._load_integrated_results(self.input_file), [])
+
+
+# ---------------------------------------------------------------------------
+# Fixtures del análisis de dominios
+# ---------------------------------------------------------------------------
+
+INTEGRATED_RESULTS = [
+    {"title": "Deep learning for fish-stock forecasting", "doi": "10.1000/a"},
+    {"title": "Machine learning in fisheries", "doi": "10.1000/b"},
+    # Mismo DOI que el primero, con otra capitalización: se descarta como duplicado
+    {"title": "Deep Learning for Fish-Stock Forecasting", "doi": "10.1000/A"},
+    {"title": "Tuna catch forecasting"},
+    {"title": "Nothing relevant here"},
+]
+
+DOMAIN_TERMS = (
+    ["deep learning", "machine learning"],
+    ["forecasting"],
+    ["fish", "fisheries", "tuna"],
+)
+
+
+class TestRunDomainAnalysis(unittest.TestCase):
+    """Pruebas para DomainAnalysisPhase._run_domain_analysis."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.tmp_dir, "integrated_results.json")
+        self.results_file = os.path.join(self.tmp_dir, "domain_analyzed_results.json")
+        self.stats_file = os.path.join(self.tmp_dir, "domain_statistics.csv")
+        with open(self.input_file, "w", encoding="utf-8") as file:
+            json.dump(INTEGRATED_RESULTS, file)
+        self.phase = DomainAnalysisPhase(MagicMock())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _run(self):
+        with patch("builtins.print"):
+            return self.phase._run_domain_analysis(
+                input_file=self.input_file,
+                output_results_file=self.results_file,
+                output_stats_file=self.stats_file,
+                domain1_terms=DOMAIN_TERMS[0],
+                domain2_terms=DOMAIN_TERMS[1],
+                domain3_terms=DOMAIN_TERMS[2],
+                domain_names=["IA", "Pronóstico", "Pesquerías"],
+            )
+
+    def test_stats_and_outputs(self):
+        with patch.object(self.phase, "_save_stats_csv", wraps=self.phase._save_stats_csv) as save_stats:
+            self.assertTrue(self._run())
+
+        stats = save_stats.call_args.args[0]
+        self.assertIsInstance(stats, dict)
+        self.assertEqual(stats["total_articles"], 4)
+        counts = {domain["name"]: domain["count"] for domain in stats["domains"]}
+        self.assertEqual(counts, {"IA": 2, "Pronóstico": 2, "Pesquerías": 3})
+        self.assertEqual(stats["intersections"]["all_domains"]["count"], 1)
+
+        with open(self.stats_file, encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[1], ["Total de artículos analizados", "4"])
+
+        with open(self.results_file, encoding="utf-8") as file:
+            results = json.load(file)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            [article["in_pesquerías_domain"] for article in results], [1, 1, 1, 0]
+        )
+
+    def test_failed_save_is_reported(self):
+        with patch.object(self.phase, "_save_stats_csv", return_value=False):
+            self.assertFalse(self._run())
+
+    def test_missing_input_is_reported(self):
+        os.remove(self.input_file)
+        self.assertFalse(self._run())
+        self.assertFalse(os.path.exists(self.stats_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests para PipelineExecutor (pipeline/pipeline_executor.py).
+
+Cobertura:
+  - TestGroupIntoLevels : agrupación de fases por dependencias, incluidas las
+                          que pasan por fases no seleccionadas.
+  - TestInputFilesExist : comprobación de los archivos de dominio.
+  - TestRunPhaseRetries : reintentos de fases fallidas.
+  - TestDurableSummary  : fsync del resumen según config.durable_summary.
+
+Ejecución:
+    python -m unittest pipeline/tests/test_pipeline_executor.py
+    python -m unittest discover
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Resolución de rutas para que los imports funcionen desde cualquier directorio
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pipeline.logger import Logger
+from pipeline.pipeline_executor import PipelineExecutor
+
+FLAGS = (
+    "only_search", "only_analysis", "only_report",
+    "skip_domain_analysis", "skip_classification", "skip_table",
+)
+
+
+def make_config(**flags) -> SimpleNamespace:
+    """Configuración mínima con todas las banderas de flujo desactivadas salvo las dadas."""
+    values = dict.fromkeys(FLAGS, False)
+    values.update(flags)
+    return SimpleNamespace(**values)
+
+
+class TestGroupIntoLevels(unittest.TestCase):
+    """Pruebas para PipelineExecutor._group_into_levels."""
+
+    def levels(self, **flags):
+        executor = PipelineExecutor(make_config(**flags))
+        levels = executor._group_into_levels(executor._get_phases_to_run())
+        return [[type(phase).__name__ for phase in level] for level in levels]
+
+    def test_full_pipeline(self):
+        self.assertEqual(self.levels(), [
+            ["SearchPhase"],
+            ["DomainAnalysisPhase"],
+            ["ClassificationPhase"],
+            ["AnalysisPhase", "TableExportPhase"],
+            ["ReportPhase"],
+        ])
+
+    def test_dependencies_resolved_through_skipped_phases(self):
+        # Sin análisis de dominios ni clasificación, las fases que dependían de
+        # ellas siguen esperando a la búsqueda que produce sus entradas
+        self.assertEqual(self.levels(skip_domain_analysis=True), [
+            ["SearchPhase"],
+            ["AnalysisPhase", "TableExportPhase"],
+            ["ReportPhase"],
+        ])
+
+    def test_unselected_dependencies_do_not_block(self):
+        self.assertEqual(self.levels(only_analysis=True), [["AnalysisPhase", "TableExportPhase"]])
+
+
+class TestInputFilesExist(unittest.TestCase):
+    """Pruebas para PipelineExecutor._input_files_exist."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        Path(self.tmp_dir, "Domain1.csv").write_text("ai\n", encoding="utf-8")
+        self.executor = PipelineExecutor(make_config())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_same_directory(self):
+        found = self.executor._input_files_exist(
+            os.path.join(self.tmp_dir, "Domain1.csv"), os.path.join(self.tmp_dir, "Domain2.csv")
+        )
+        self.assertEqual(found, (True, False))
+
+    def test_name_missing_from_listing_falls_back_to_exists(self):
+        # Simula un sistema de archivos sin distinción de mayúsculas (Windows, macOS)
+        path = os.path.join(self.tmp_dir, "domain1.csv")
+        with patch("pipeline.pipeline_executor.os.path.exists", return_value=True) as exists:
+            self.assertEqual(self.executor._input_files_exist(path), (True,))
+        exists.assert_called_once_with(path)
+
+
+class TestRunPhaseRetries(unittest.TestCase):
+    """Pruebas para los reintentos de PipelineExecutor._run_phase."""
+
+    def failing_phase(self) -> MagicMock:
+        phase = MagicMock()
+        phase.get_description.return_value = "Fase de prueba"
+        phase.run.return_value = False
+        return phase
+
+    def executor(self, **flags) -> PipelineExecutor:
+        executor = PipelineExecutor(make_config(**flags))
+        executor.logger = MagicMock()
+        return executor
+
+    def test_failed_phase_runs_once_by_default(self):
+        phase = self.failing_phase()
+        self.assertFalse(self.executor()._run_phase(phase))
+        self.assertEqual(phase.run.call_count, 1)
+
+    def test_retry_count_from_config(self):
+        phase = self.failing_phase()
+        self.assertFalse(self.executor(retry_count=3, retry_backoff=0)._run_phase(phase))
+        self.assertEqual(phase.run.call_count, 3)
+
+
+class TestDurableSummary(unittest.TestCase):
+    """Pruebas para el fsync opcional de Logger.save_summary."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.summary_file = os.path.join(self.tmp_dir, "pipeline_execution.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def save_summary(self, **flags) -> MagicMock:
+        """Guarda el resumen con el Logger del ejecutor y devuelve el mock de os.fsync."""
+        logger = PipelineExecutor(make_config(**flags)).logger
+        with patch("pipeline.logger.os.fsync") as fsync:
+            logger.save_summary(self.summary_file)
+        logger.close()
+        with open(self.summary_file, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["total_phases"], 0)
+        return fsync
+
+    def test_no_fsync_by_default(self):
+        self.save_summary().assert_not_called()
+
+    def test_fsync_when_durable_summary_is_set(self):
+        self.save_summary(durable_summary=True).assert_called_once()
+
+    def test_logger_default_is_not_durable(self):
+        self.assertFalse(Logger().durable_summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests para el protocolo de frames del worker de fases (pipeline/worker.py).
+
+Cobertura:
+  - TestFrames       : ida y vuelta de frames con prefijo de longitud.
+  - TestWorkerProcess: worker real en un subproceso; salida en streaming,
+                       códigos de salida y muerte del worker.
+
+Ejecución:
+    python -m unittest pipeline/tests/test_worker.py
+    python -m unittest discover
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+# Resolución de rutas para que los imports funcionen desde cualquier directorio
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from pipeline.worker import read_frame, write_frame
+
+WORKER_SCRIPT = str(Path(__file__).parent.parent / "worker.py")
+
+
+class TestFrames(unittest.TestCase):
+    """Pruebas de read_frame/write_frame sobre un buffer en memoria."""
+
+    def test_round_trip(self):
+        stream = io.BytesIO()
+        write_frame(stream, {"phase": "análisis.py", "args": ["--x", "1"]})
+        write_frame(stream, {"status": 0})
+        stream.seek(0)
+        self.assertEqual(read_frame(stream), {"phase": "análisis.py", "args": ["--x", "1"]})
+        self.assertEqual(read_frame(stream), {"status": 0})
+        self.assertIsNone(read_frame(stream))
+
+    def test_truncated_header_is_end_of_stream(self):
+        self.assertIsNone(read_frame(io.BytesIO(b"\x05\x00")))
+
+
+class TestWorkerProcess(unittest.TestCase):
+    """Pruebas contra un worker real, como lo arranca PhaseRunner."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.worker = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+    def tearDown(self):
+        self.worker.stdin.close()
+        self.worker.wait(timeout=10)
+        self.worker.stdout.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _script(self, name: str, source: str) -> str:
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(textwrap.dedent(source))
+        return path
+
+    def _run(self, phase: str, args=()):
+        """Envía una fase y devuelve (texto de salida, frame final o None)."""
+        write_frame(self.worker.stdin, {"phase": phase, "args": list(args)})
+        output = []
+        response = read_frame(self.worker.stdout)
+        while response is not None and "status" not in response:
+            output.append(response["stdout"])
+            response = read_frame(self.worker.stdout)
+        return "".join(output), response
+
+    def test_streams_output_and_status(self):
+        script = self._script("fase.py", """
+            import sys
+            print("hola", sys.argv[1:])
+            print("sin salto", end="")
+        """)
+        output, response = self._run(script, ["--n", "2"])
+        self.assertEqual(response, {"status": 0})
+        self.assertEqual(output, "hola ['--n', '2']\nsin salto")
+
+    def test_stdout_behaves_like_a_text_stream(self):
+        script = self._script("reconfigura.py", """
+            import sys
+            sys.stdout.reconfigure(encoding="utf-8")
+            print("Pesquerías", sys.stdout.encoding)
+            sys.stdout.buffer.write("señal\\n".encode("utf-8"))
+        """)
+        output, response = self._run(script)
+        self.assertEqual(response, {"status": 0})
+        self.assertEqual(output, "Pesquerías utf-8\nseñal\n")
+
+    def test_script_directory_is_importable(self):
+        self._script("ayudante.py", "VALOR = 7\n")
+        script = self._script("importa.py", """
+            from ayudante import VALOR
+            print(VALOR)
+        """)
+        output, response = self._run(script)
+        self.assertEqual(response, {"status": 0})
+        self.assertEqual(output, "7\n")
+
+    def test_non_zero_exit(self):
+        script = self._script("falla.py", """
+            import sys
+            sys.exit(3)
+        """)
+        self.assertEqual(self._run(script)[1], {"status": 3})
+
+    def test_exception_reports_traceback(self):
+        script = self._script("excepcion.py", "raise RuntimeError('boom')\n")
+        output, response = self._run(script)
+        self.assertEqual(response, {"status": 1})
+        self.assertIn("RuntimeError: boom", output)
+
+    def test_worker_serves_several_phases(self):
+        first = self._script("uno.py", "print(1)\n")
+        second = self._script("dos.py", "print(2)\n")
+        self.assertEqual(self._run(first), ("1\n", {"status": 0}))
+        self.assertEqual(self._run(second), ("2\n", {"status": 0}))
+
+    def test_worker_death_ends_stream(self):
+        script = self._script("muere.py", """
+            import os
+            print("antes", flush=True)
+            os._exit(9)
+        """)
+        output, response = self._run(script)
+        self.assertIsNone(response)
+        self.assertEqual(output, "antes\n")
+        self.assertEqual(self.worker.wait(timeout=10), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Long-lived worker that executes phase scripts inside a single interpreter.
+
+The parent process starts the worker once with ``python worker.py`` and sends
+one frame per phase on its stdin. Each frame is a 4-byte little-endian length
+prefix followed by a UTF-8 JSON payload. Output is streamed back line by line
+while the phase runs, and a final frame carries its exit status:
+
+    request:  {"phase": "analysis_generator.py", "args": ["--figures-dir", "figures"]}
+    output:   {"stdout": "..."}
+    response: {"status": 0}
+"""
+import codecs
+import io
+import json
+import os
+import runpy
+import struct
+import sys
+import traceback
+from contextlib import redirect_stdout
+from typing import Any, BinaryIO, Dict, List, Optional
+
+_HEADER = struct.Struct('<I')
+
+def read_frame(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read one length-prefixed JSON frame. Returns None on end of stream."""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (length,) = _HEADER.unpack(header)
+    return json.loads(stream.read(length).decode('utf-8'))
+
+def write_frame(stream: BinaryIO, payload: Dict[str, Any]) -> None:
+    """Write one length-prefixed JSON frame and flush it."""
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+class _FrameWriter(io.RawIOBase):
+    """Raw byte stream that forwards what a phase prints to the parent as output frames."""
+    def __init__(self, channel: BinaryIO):
+        self._channel = channel
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        # A multi-byte character split across writes is held until it is complete
+        text = self._decoder.decode(bytes(data))
+        if text:
+            write_frame(self._channel, {"stdout": text})
+        return len(data)
+
+def _open_output(channel: BinaryIO) -> io.TextIOWrapper:
+    """Build the stdout a phase sees: a regular text stream over the frame channel.
+
+    It has the ``buffer``, ``encoding`` and ``reconfigure`` that scripts expect
+    from ``sys.stdout``, and is line-buffered so output reaches the parent as
+    the phase prints it.
+    """
+    return io.TextIOWrapper(io.BufferedWriter(_FrameWriter(channel)), encoding='utf-8',
+                            newline='\n', line_buffering=True)
+
+def _run_phase(phase: str, args: List[str], output: io.TextIOWrapper) -> int:
+    """Run a phase script as ``__main__``, streaming its output, and return its exit status."""
+    saved_argv = sys.argv
+    saved_path = sys.path[:]
+    sys.argv = [phase, *args]
+    # Like ``python script.py``, the script's own directory comes first on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(phase)))
+    status = 0
+    try:
+        with redirect_stdout(output):
+            try:
+                runpy.run_path(phase, run_name="__main__")
+            finally:
+                # The script may have swapped in its own wrapper around sys.stdout.buffer
+                if sys.stdout is not output and not sys.stdout.closed:
+                    sys.stdout.flush()
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            output.write(f"{e.code}\n")
+            status = 1
+    except Exception:
+        output.write(traceback.format_exc())
+        status = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        if not output.closed:
+            output.flush()
+    return status
+
+def serve() -> None:
+    """Process phase frames from stdin until the parent closes the pipe."""
+    # Keep a private handle on the real stdout for frames and point fd 1 at
+    # stderr, so stray writes from child processes can't corrupt the protocol.
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    while True:
+        request = read_frame(sys.stdin.buffer)
+        if request is None:
+            break
+        status = _run_phase(request["phase"], request.get("args", []), _open_output(channel))
+        write_frame(channel, {"status": status})
+
+    channel.close()
+
+if __name__ == "__main__":
+    serve()
@@ -22,6 +22,9 @@ _ELSEVIER_APIKEY_PATHS = [
     Path(__file__).parent.parent / "secrets" / "sciencedirect_apikey.txt",
 ]
 
+# Separador de palabras clave de Scopus ("a | b" o "a, b"), incluyendo espacios alrededor
+_KEYWORD_SPLIT = re.compile(r"\s*[|,]\s*")
+
 
 class BaseAdapter(ABC):
     """Clase base para adaptadores de APIs científicas."""
@@ -567,7 +570,7 @@ class ScopusAdapter(BaseAdapter):
 
         raw_keywords = entry.get("authkeywords", "")
         keywords = (
-            [k.strip() for k in raw_keywords.replace("|", ",").split(",") if k.strip()]
+            [k for k in _KEYWORD_SPLIT.split(raw_keywords.strip()) if k]
             if raw_keywords else []
         )
 
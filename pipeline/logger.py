@@ -2,68 +2,114 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import os
 import json
+import threading
 
 class Logger:
-    def __init__(self, log_file: str = "pipeline.log"):
+    def __init__(self, log_file: str = "pipeline.log", durable_summary: bool = False,
+                 echo_to_stdout: bool = False, events_file: Optional[str] = None):
         self.log_file = log_file
+        self.events_file = events_file
+        self.durable_summary = durable_summary
+        self.echo_to_stdout = echo_to_stdout
         self.start_time = None
         self.phases = []
         self.current_phase = None
+        self._active_phases: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._fh = None
+        self._events_fh = None
+        self._pipeline_open = False
+        
+    def __enter__(self) -> "Logger":
+        self.start_pipeline()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._pipeline_open:
+            self.end_pipeline(exc_type is None)
+        self.close()
         
     def start_pipeline(self) -> None:
         """Start pipeline execution and record start time."""
         self.start_time = datetime.now()
-        self._log(f"\n====== STARTING PIPELINE EXECUTION AT {self.start_time} ======\n")
+        self._pipeline_open = True
+        started_at = self.start_time.isoformat(timespec='seconds')
+        self._log(f"\n====== STARTING PIPELINE EXECUTION AT {started_at} ======\n")
+        self._emit({'type': 'start', 'time': self.start_time.isoformat()})
     
     def end_pipeline(self, success: bool, stats: Optional[Dict[str, Any]] = None) -> None:
         """Record pipeline end with statistics."""
+        self._pipeline_open = False
         end_time = datetime.now()
         duration = end_time - self.start_time if self.start_time else None
         
         status = "COMPLETED" if success else "FAILED"
-        self._log(f"\n====== PIPELINE {status} AT {end_time} ======")
+        ended_at = end_time.isoformat(timespec='seconds')
+        self._log(f"\n====== PIPELINE {status} AT {ended_at} ======")
         
         if duration:
             self._log(f"Total execution time: {duration.total_seconds():.2f} seconds")
         
         if stats:
-            self._log("\nExecution Statistics:")
-            for key, value in stats.items():
-                self._log(f"  {key}: {value}")
+            self._log_mapping("\nExecution Statistics:", stats)
+        
+        self._emit({'type': 'end', 'time': end_time.isoformat(), 'success': success, 'stats': stats or {}})
     
     def start_phase(self, phase_name: str) -> None:
         """Log the start of a pipeline phase."""
-        self.current_phase = {
+        phase = {
             'name': phase_name,
             'start_time': datetime.now()
         }
-        self._log(f"\n----- STARTING PHASE: {phase_name} -----")
+        with self._lock:
+            self._active_phases[phase_name] = phase
+            self.current_phase = phase
+            self._log(f"\n----- STARTING PHASE: {phase_name} -----")
+            self._emit({'type': 'phase_start', 'name': phase_name, 'time': phase['start_time'].isoformat()})
     
-    def end_phase(self, success: bool, details: Optional[Dict[str, Any]] = None) -> None:
-        """Log the end of a pipeline phase with results."""
-        if self.current_phase:
+    def end_phase(self, success: bool, details: Optional[Dict[str, Any]] = None,
+                  phase_name: Optional[str] = None) -> None:
+        """Log the end of a pipeline phase with results.
+
+        Phases running concurrently are ended by name; without one, the most
+        recently started phase is ended.
+        """
+        with self._lock:
+            phase = self._active_phases.get(phase_name) if phase_name else self.current_phase
+            if not phase:
+                return
+            
             end_time = datetime.now()
-            duration = end_time - self.current_phase['start_time']
+            duration = end_time - phase['start_time']
             
-            self.current_phase.update({
+            phase.update({
                 'end_time': end_time,
                 'duration': duration.total_seconds(),
                 'success': success,
                 'details': details or {}
             })
             
-            self.phases.append(self.current_phase)
+            self.phases.append(phase)
             
             status = "SUCCESS" if success else "FAILED"
-            self._log(f"----- PHASE {self.current_phase['name']} {status} -----")
+            self._log(f"----- PHASE {phase['name']} {status} -----")
             self._log(f"Duration: {duration.total_seconds():.2f} seconds")
             
             if details:
-                self._log("Details:")
-                for key, value in details.items():
-                    self._log(f"  {key}: {value}")
+                self._log_mapping("Details:", details)
+            
+            self._emit({
+                'type': 'phase_end',
+                'name': phase['name'],
+                'time': end_time.isoformat(),
+                'duration': phase['duration'],
+                'success': success,
+                'details': phase['details']
+            })
             
-            self.current_phase = None
+            del self._active_phases[phase['name']]
+            if self.current_phase is phase:
+                self.current_phase = None
     
     def log_error(self, error: Exception, phase: Optional[str] = None) -> None:
         """Log an error with details."""
@@ -92,7 +138,7 @@ class Logger:
         }
     
     def save_summary(self, filepath: str) -> None:
-        """Save execution summary to a JSON file."""
+        """Save execution summary to a JSON file, replacing it atomically."""
         summary = self.get_summary()
         # Convert datetime objects to strings
         summary['start_time'] = summary['start_time'].isoformat() if summary['start_time'] else None
@@ -101,13 +147,50 @@ class Logger:
             phase['end_time'] = phase['end_time'].isoformat()
         
         os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=4, ensure_ascii=False)
+            if self.durable_summary:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    
+    def close(self) -> None:
+        """Flush and close the log file handle."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._events_fh is not None:
+            self._events_fh.close()
+            self._events_fh = None
+    
+    def _log_mapping(self, header: str, values: Dict[str, Any]) -> None:
+        """Log a header followed by indented key/value lines as a single message."""
+        lines = [header]
+        lines.extend(f"  {key}: {value}" for key, value in values.items())
+        self._log("\n".join(lines))
+    
+    def _emit(self, event: Dict[str, Any]) -> None:
+        """Append one event as a JSON line to the events file, if one is configured.
+
+        The file is line-buffered and truncated at the start of each run, so it
+        can be followed with tail -f while the pipeline is running.
+        """
+        if not self.events_file:
+            return
+        with self._lock:
+            if self._events_fh is None:
+                os.makedirs(os.path.dirname(self.events_file) or '.', exist_ok=True)
+                self._events_fh = open(self.events_file, 'w', encoding='utf-8', buffering=1)
+            self._events_fh.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
     
     def _log(self, message: str) -> None:
-        """Write a message to the log file and print it."""
-        print(message)
-        
-        os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(f"{message}\n")
+        """Write a message to the log file, echoing it to stdout if enabled."""
+        with self._lock:
+            if self.echo_to_stdout:
+                print(message)
+            
+            if self._fh is None:
+                os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
+                self._fh = open(self.log_file, 'a', encoding='utf-8')
+            self._fh.write(f"{message}\n")
@@ -93,7 +93,7 @@ def load_progress() -> dict:
 
 def save_progress(progress: dict) -> None:
     PROGRESS_FILE.write_text(
-        json.dumps(progress, ensure_ascii=False, indent=2),
+        json.dumps(progress, ensure_ascii=False, separators=(",", ":")),
         encoding="utf-8",
     )
 
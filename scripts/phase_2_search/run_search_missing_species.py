@@ -111,7 +111,7 @@ def load_progress() -> dict:
 
 
 def save_progress(progress: dict) -> None:
-    PROGRESS_FILE.write_text(json.dumps(progress, ensure_ascii=False, indent=2), encoding="utf-8")
+    PROGRESS_FILE.write_text(json.dumps(progress, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
 
 
 def load_paywall() -> list:
@@ -212,7 +212,7 @@ def main() -> None:
     paywall_records = load_paywall()
     found_total = 0
     processed = 0
-    start = time.time()
+    start = time.perf_counter()
 
     for idx, species_name in enumerate(missing, 1):
         # Saltar si ya procesada y el CSV ya existe con contenido
@@ -241,7 +241,7 @@ def main() -> None:
 
         # Log
         if processed % 50 == 0:
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             rate = processed / elapsed * 60
             remaining = (len(missing) - idx) / (rate / 60) / 60 if rate > 0 else 0
             logger.info(
@@ -263,7 +263,7 @@ def main() -> None:
     # Guardar paywall final
     save_paywall(paywall_records)
 
-    elapsed_total = time.time() - start
+    elapsed_total = time.perf_counter() - start
     logger.info("")
     logger.info("=" * 70)
     logger.info(f"Búsqueda completada en {elapsed_total/3600:.1f}h")
@@ -17,16 +17,23 @@ Configuración:
 
 from __future__ import annotations
 
+import atexit
 import csv
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Cargar variables de entorno
 _project_root = Path(__file__).parent
@@ -52,8 +59,148 @@ TIMEOUT = 15
 SLEEP_PUBMED = 0.3  # segundos entre peticiones PubMed
 SLEEP_CROSSREF = 0.1
 SLEEP_ARXIV = 0.1
+SLEEP_BIORXIV = 0.2
+SLEEP_PLOS = 0.2
+SLEEP_FRONTIERS = 0.5
+SLEEP_ELIFE = 0.5
 
+# Caché en disco de respuestas de Elsevier (Scopus/ScienceDirect) para no gastar cuota al re-ejecutar.
+# ELSEVIER_CACHE=0 la desactiva por completo
+ELSEVIER_CACHE_DIR = Path(__file__).resolve().parents[2] / "outputs" / ".cache" / "elsevier"
+ELSEVIER_CACHE_TTL = 7 * 24 * 3600  # segundos
+ELSEVIER_CACHE_ENABLED = os.getenv("ELSEVIER_CACHE", "1").strip() != "0"
 
+# Correo de contacto para el "polite pool" de CrossRef (menor latencia y menos 429)
+CROSSREF_MAILTO = os.getenv("CROSSREF_MAILTO", "").strip()
+
+
+class _RateLimiter:
+    """Espacia las peticiones a un servicio respetando un intervalo mínimo.
+
+    Solo duerme lo que falta del intervalo desde la petición anterior, en vez de
+    una pausa fija antes de cada petición. Es seguro entre hilos.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Reintentos con backoff exponencial (1s, 2s, 4s) ante límites de tasa y errores
+# transitorios del servidor; respeta Retry-After en las respuestas 429
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Sesión compartida: reutiliza conexiones TCP/TLS con cada servicio entre peticiones
+# y entre llamadas sucesivas desde otros scripts; se crea en el primer uso
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Devuelve la sesión HTTP compartida, creándola (y registrando su cierre) la primera vez."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+            session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_RETRY))
+            atexit.register(session.close)
+            _SESSION = session
+        return _SESSION
+
+
+_PUBMED_LIMITER = _RateLimiter(SLEEP_PUBMED)
+_CROSSREF_LIMITER = _RateLimiter(SLEEP_CROSSREF)
+_SCIENCEDIRECT_LIMITER = _RateLimiter(SLEEP_CROSSREF)
+_SCOPUS_LIMITER = _RateLimiter(SLEEP_CROSSREF)
+_ARXIV_LIMITER = _RateLimiter(SLEEP_ARXIV)
+_BIORXIV_LIMITER = _RateLimiter(SLEEP_BIORXIV)
+_PLOS_LIMITER = _RateLimiter(SLEEP_PLOS)
+_FRONTIERS_LIMITER = _RateLimiter(SLEEP_FRONTIERS)
+_ELIFE_LIMITER = _RateLimiter(SLEEP_ELIFE)
+
+
+def _get_elsevier_json(
+    url: str,
+    params: dict[str, Any],
+    limiter: _RateLimiter,
+    headers: dict[str, str] | None = None,
+    use_cache: bool = True,
+) -> tuple[int, dict[str, Any]]:
+    """GET a la API de Elsevier usando la caché en disco para respuestas correctas.
+
+    La clave de caché es la URL más los parámetros (sin la API key). Solo se
+    guardan respuestas 200 con resultados; los errores y las búsquedas vacías
+    siempre se vuelven a consultar. Con use_cache=False no se lee la caché, pero
+    la respuesta nueva sí se guarda. Escribir la caché es opcional: si falla, se
+    devuelve igualmente la respuesta.
+
+    Returns:
+        Código de estado HTTP y JSON de la respuesta (vacío si no es 200)
+    """
+    key_params = {k: v for k, v in params.items() if k != "apiKey"}
+    key = hashlib.sha256(json.dumps([url, key_params], sort_keys=True).encode("utf-8")).hexdigest()
+    cache_path = ELSEVIER_CACHE_DIR / f"{key}.json"
+
+    if use_cache and ELSEVIER_CACHE_ENABLED:
+        try:
+            if time.time() - cache_path.stat().st_mtime < ELSEVIER_CACHE_TTL:
+                return 200, json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    limiter.wait()
+    resp = _get_session().get(url, params=params, headers=headers, timeout=TIMEOUT)
+    if resp.status_code != 200:
+        return resp.status_code, {}
+
+    data = resp.json()
+    if ELSEVIER_CACHE_ENABLED and _has_elsevier_entries(data):
+        _write_elsevier_cache(cache_path, data)
+    return 200, data
+
+
+def _has_elsevier_entries(data: dict[str, Any]) -> bool:
+    """Indica si una respuesta de búsqueda de Elsevier trae algún resultado.
+
+    Las búsquedas vacías devuelven una única entrada con "error" ("Result set was empty").
+    """
+    entries = data.get("search-results", {}).get("entry", [])
+    return any("error" not in entry for entry in entries)
+
+
+def _write_elsevier_cache(cache_path: Path, data: dict[str, Any]) -> None:
+    """Guarda una respuesta en la caché de Elsevier; los errores solo se registran."""
+    tmp_path = cache_path.with_suffix(".tmp")
+    payload = json.dumps(data, ensure_ascii=False)
+    try:
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+        except FileNotFoundError:
+            # Solo la primera escritura necesita crear el directorio de caché
+            ELSEVIER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"No se pudo escribir la caché de Elsevier {cache_path.name}: {e}")
+
+
+@lru_cache(maxsize=8)
 def _load_api_key(env_var: str, secret_file: str) -> str:
 	"""Carga API key desde variable de entorno o archivo secrets/.
 
@@ -100,7 +247,8 @@ def search_pubmed(species_name: str, region_terms: list[str] | None = None) -> l
             "rettype": "json",
         }
 
-        search_resp = requests.get(search_url, params=search_params, timeout=TIMEOUT)
+        _PUBMED_LIMITER.wait()
+        search_resp = _get_session().get(search_url, params=search_params, timeout=TIMEOUT)
         if search_resp.status_code != 200:
             return results
 
@@ -118,8 +266,8 @@ def search_pubmed(species_name: str, region_terms: list[str] | None = None) -> l
             "rettype": "json",
         }
 
-        time.sleep(SLEEP_PUBMED)
-        fetch_resp = requests.get(fetch_url, params=fetch_params, timeout=TIMEOUT)
+        _PUBMED_LIMITER.wait()
+        fetch_resp = _get_session().get(fetch_url, params=fetch_params, timeout=TIMEOUT)
 
         if fetch_resp.status_code == 200:
             fetch_data = fetch_resp.json()
@@ -179,8 +327,14 @@ def search_crossref(species_name: str, region_terms: list[str] | None = None) ->
             "order": "desc",
         }
 
-        time.sleep(SLEEP_CROSSREF)
-        resp = requests.get(CROSSREF_BASE, params=params, timeout=TIMEOUT)
+        # Con un mailto, CrossRef enruta la petición al polite pool
+        headers = {}
+        if CROSSREF_MAILTO:
+            params["mailto"] = CROSSREF_MAILTO
+            headers["User-Agent"] = f"scientific_review/1.0 (mailto:{CROSSREF_MAILTO})"
+
+        _CROSSREF_LIMITER.wait()
+        resp = _get_session().get(CROSSREF_BASE, params=params, headers=headers, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
@@ -213,13 +367,19 @@ def search_crossref(species_name: str, region_terms: list[str] | None = None) ->
     return results
 
 
-def search_sciencedirect(species_name: str, api_key: str = "", region_terms: list[str] | None = None) -> list[dict[str, Any]]:
+def search_sciencedirect(
+    species_name: str,
+    api_key: str = "",
+    region_terms: list[str] | None = None,
+    use_cache: bool = True,
+) -> list[dict[str, Any]]:
     """Busca en ScienceDirect (requiere API key en env var SCIENCEDIRECT_API_KEY o secrets/sciencedirect_apikey.txt).
 
     Args:
         species_name: nombre de la especie a buscar
         api_key: API key opcional. Si no se proporciona, se carga desde env/secrets
         region_terms: términos geográficos opcionales para filtrar resultados
+        use_cache: si es False, consulta la API aunque haya una respuesta en caché
 
     Returns:
         Lista de artículos encontrados
@@ -243,17 +403,15 @@ def search_sciencedirect(species_name: str, api_key: str = "", region_terms: lis
             "apiKey": api_key,
         }
 
-        time.sleep(SLEEP_CROSSREF)
-        resp = requests.get(SCIENCEDIRECT_BASE, params=params, timeout=TIMEOUT)
+        status, data = _get_elsevier_json(SCIENCEDIRECT_BASE, params, _SCIENCEDIRECT_LIMITER, use_cache=use_cache)
 
-        if resp.status_code == 401:
+        if status == 401:
             logger.warning("ScienceDirect no autorizado para esta API key")
             return results
 
-        if resp.status_code != 200:
+        if status != 200:
             return results
 
-        data = resp.json()
         items = data.get("search-results", {}).get("entry", [])
 
         for item in items:
@@ -276,13 +434,19 @@ def search_sciencedirect(species_name: str, api_key: str = "", region_terms: lis
     return results
 
 
-def search_scopus(species_name: str, api_key: str = "", region_terms: list[str] | None = None) -> list[dict[str, Any]]:
+def search_scopus(
+    species_name: str,
+    api_key: str = "",
+    region_terms: list[str] | None = None,
+    use_cache: bool = True,
+) -> list[dict[str, Any]]:
     """Busca en Scopus (requiere API key en env var SCOPUS_API_KEY o secrets/scopus_apikey.txt).
 
     Args:
         species_name: nombre de la especie a buscar
         api_key: API key opcional. Si no se proporciona, se carga desde env/secrets
         region_terms: términos geográficos opcionales para filtrar resultados
+        use_cache: si es False, consulta la API aunque haya una respuesta en caché
 
     Returns:
         Lista de artículos encontrados
@@ -310,13 +474,13 @@ def search_scopus(species_name: str, api_key: str = "", region_terms: list[str]
             "sort": "date",
         }
 
-        time.sleep(SLEEP_CROSSREF)
-        resp = requests.get(SCOPUS_BASE, params=params, headers=headers, timeout=TIMEOUT)
+        status, data = _get_elsevier_json(
+            SCOPUS_BASE, params, _SCOPUS_LIMITER, headers=headers, use_cache=use_cache
+        )
 
-        if resp.status_code != 200:
+        if status != 200:
             return results
 
-        data = resp.json()
         items = data.get("search-results", {}).get("entry", [])
 
         for item in items:
@@ -373,8 +537,8 @@ def search_arxiv(species_name: str, region_terms: list[str] | None = None) -> li
             "sort_order": "descending",
         }
 
-        time.sleep(SLEEP_ARXIV)
-        resp = requests.get(ARXIV_BASE, params=params, timeout=TIMEOUT)
+        _ARXIV_LIMITER.wait()
+        resp = _get_session().get(ARXIV_BASE, params=params, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
@@ -434,17 +598,23 @@ def search_biorxiv(species_name: str, region_terms: list[str] | None = None) ->
         search_url = f"{BIORXIV_BASE}/biorxiv/{start_date.isoformat()}/{today.isoformat()}"
         params = {"sort": "date", "direction": "descending"}
 
-        time.sleep(0.2)
-        resp = requests.get(search_url, params=params, timeout=TIMEOUT)
+        _BIORXIV_LIMITER.wait()
+        resp = _get_session().get(search_url, params=params, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
 
         data = resp.json()
         query_lower = species_name.lower()
+        region_str = " ".join(t.lower() for t in region_terms) if region_terms else ""
 
         for preprint in data.get("collection", []):
-            title = preprint.get("title", "").lower()
+            title = preprint.get("title", "")
+            # Los preprints sin título se descartan igualmente al deduplicar
+            if not title:
+                continue
+
+            title = title.lower()
             abstract = preprint.get("abstract", "").lower()
 
             # Buscar especie en título o abstract
@@ -452,10 +622,8 @@ def search_biorxiv(species_name: str, region_terms: list[str] | None = None) ->
                 continue
 
             # Filtrar por región si se proporciona
-            if region_terms:
-                region_str = " ".join([t.lower() for t in region_terms])
-                if region_str not in title and region_str not in abstract:
-                    continue
+            if region_str and region_str not in title and region_str not in abstract:
+                continue
 
             doi = preprint.get("doi", "")
             date_str = preprint.get("date", "")
@@ -510,8 +678,8 @@ def search_plos(species_name: str, region_terms: list[str] | None = None) -> lis
             "sort": "publication_date desc",
         }
 
-        time.sleep(0.2)
-        resp = requests.get(PLOS_BASE, params=params, timeout=TIMEOUT)
+        _PLOS_LIMITER.wait()
+        resp = _get_session().get(PLOS_BASE, params=params, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
@@ -567,8 +735,8 @@ def search_frontiers(species_name: str, region_terms: list[str] | None = None) -
             "sort_by": "date",
         }
 
-        time.sleep(0.5)
-        resp = requests.get(FRONTIERS_BASE, params=params, timeout=TIMEOUT)
+        _FRONTIERS_LIMITER.wait()
+        resp = _get_session().get(FRONTIERS_BASE, params=params, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
@@ -639,8 +807,8 @@ def search_elife(species_name: str, region_terms: list[str] | None = None) -> li
             "order": "desc",
         }
 
-        time.sleep(0.5)
-        resp = requests.get(ELIFE_BASE, params=params, timeout=TIMEOUT)
+        _ELIFE_LIMITER.wait()
+        resp = _get_session().get(ELIFE_BASE, params=params, timeout=TIMEOUT)
 
         if resp.status_code != 200:
             return results
@@ -721,18 +889,24 @@ def search_articles_for_species(species_name: str, region_terms: list[str] | Non
     """
     logger.debug(f"Buscando artículos para: {species_name}")
 
-    all_results = []
-
     # Buscar en cada base de datos (en orden de relevancia)
-    all_results.extend(search_pubmed(species_name, region_terms=region_terms))
-    all_results.extend(search_crossref(species_name, region_terms=region_terms))
-    all_results.extend(search_scopus(species_name, region_terms=region_terms))  # Si está configurado
-    all_results.extend(search_sciencedirect(species_name, region_terms=region_terms))  # Si está configurado
-    all_results.extend(search_frontiers(species_name, region_terms=region_terms))
-    all_results.extend(search_elife(species_name, region_terms=region_terms))
-    all_results.extend(search_arxiv(species_name, region_terms=region_terms))
-    all_results.extend(search_biorxiv(species_name, region_terms=region_terms))
-    all_results.extend(search_plos(species_name, region_terms=region_terms))
+    sources = [
+        search_pubmed,
+        search_crossref,
+        search_scopus,  # Si está configurado
+        search_sciencedirect,  # Si está configurado
+        search_frontiers,
+        search_elife,
+        search_arxiv,
+        search_biorxiv,
+        search_plos,
+    ]
+
+    # Las peticiones son de red, así que se lanzan en paralelo; map conserva
+    # el orden de relevancia para la deduplicación posterior
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        source_results = executor.map(lambda search: search(species_name, region_terms=region_terms), sources)
+        all_results = [article for results in source_results for article in results]
 
     # Filtro de relevancia: el título debe mencionar el nombre de la especie.
     # PubMed y Scopus ya son semánticamente precisos; CrossRef y ArXiv no.
@@ -743,14 +917,21 @@ def search_articles_for_species(species_name: str, region_terms: list[str] | Non
         or _title_contains_species(r.get("title", ""), species_name)
     ]
 
-    # Remover duplicados por título
+    # Remover duplicados por título o DOI: distintas fuentes pueden dar el mismo
+    # artículo con el título formateado de otra manera. Se queda el de la fuente
+    # más relevante.
     seen_titles = set()
+    seen_dois = set()
     unique_results = []
     for result in all_results:
         title = result.get("title", "").lower()
-        if title and title not in seen_titles:
-            seen_titles.add(title)
-            unique_results.append(result)
+        doi = (result.get("doi") or "").lower()
+        if not title or title in seen_titles or (doi and doi in seen_dois):
+            continue
+        seen_titles.add(title)
+        if doi:
+            seen_dois.add(doi)
+        unique_results.append(result)
 
     return unique_results[:MAX_RESULTS]
 
@@ -850,8 +1031,9 @@ def search_articles_batch(
         # Guardar progreso
         progress[species_name] = len(articles)
         if progress_file:
+            # Se reescribe tras cada especie, así que va compacto
             progress_file.write_text(
-                json.dumps(progress, ensure_ascii=False, indent=2),
+                json.dumps(progress, ensure_ascii=False, separators=(",", ":")),
                 encoding="utf-8",
             )
 
@@ -242,14 +242,14 @@ def main():
     print("BÚSQUEDA DE ARTÍCULOS EN FUENTES ABIERTAS")
     print("=" * 70)
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     stats = search_species(
         species_list,
         sources=sources,
         output_dir=args.output_dir,
         max_results_per_source=args.max_results,
     )
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
 
     # Resumen final
     print("\n" + "=" * 70)
@@ -99,8 +99,9 @@ def search_species(species_name: str) -> list[dict]:
     all_results.extend(search_pubmed(species_name))
     all_results.extend(search_crossref(species_name))
     all_results.extend(search_arxiv(species_name))
-    # Scopus también si hay API key configurada
-    scopus_results = search_scopus(species_name)
+    # Scopus también si hay API key configurada. Sin caché: estas especies se
+    # re-buscan justamente porque la respuesta anterior vino vacía
+    scopus_results = search_scopus(species_name, use_cache=False)
     all_results.extend(scopus_results)
 
     # Filtro de relevancia para fuentes ruidosas